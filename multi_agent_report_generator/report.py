@@ -4,38 +4,188 @@ This module implements a multi-agent system for generating research reports
 on various topics using web research, trend analysis, report writing, and proofreading agents.
 """
 
-from crewai import Crew, Task, Agent, Process, LLM  # pyright: ignore[reportMissingImports]
-from langchain_community.tools import BraveSearch
+from __future__ import annotations
 
+import argparse
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import logging
 import os
+import queue
+import random
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import date
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
+from dotenv import load_dotenv
 
-from services.email_sender import send_email_with_attachment
+from services.email_sender import EmailSender
 from services.pdf_generator import save_report_to_pdf
+from services.report_cache import (
+    load_cached_report,
+    make_cache_key,
+    store_cached_report,
+)
 
+# crewai (with litellm and pydantic) and httpx are slow to import, so they are
+# only loaded on first use; see _crewai() and _get_brave_client()
+if TYPE_CHECKING:
+    import httpx
+    from crewai import LLM, Agent  # pyright: ignore[reportMissingImports]
+    from crewai.tasks.task_output import TaskOutput  # pyright: ignore[reportMissingImports]
 
-from dotenv import load_dotenv
- 
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOPIC: str = "NYC Real Estate Market"
+GPT_4O_MODEL: str = "openai/gpt-4o"
+GPT_4O_MINI_MODEL: str = "openai/gpt-4o-mini"
+MAX_PARALLEL_TOPICS: int = 4
+LAST_OUTPUT_FILENAME: str = "last_output.json"
+_OUTPUTS_DIR: Path = Path(__file__).resolve().parent / "outputs"
+
+
+class ResearchSpecialist(NamedTuple):
+    """Persona and focus area of one research sub-crew."""
+
+    name: str
+    role: str
+    focus: str
+    backstory: str
 
-from datetime import date
-as_of = date.today().isoformat()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Research specialists run concurrently, one sub-crew each
+RESEARCH_SPECIALISTS: Tuple[ResearchSpecialist, ...] = (
+    ResearchSpecialist(
+        name="Market Researcher",
+        role="Market Data Specialist",
+        focus="market data and key statistics",
+        backstory=(
+            "You are a former financial journalist who tracks prices, volumes, and official "
+            "statistics. You excel at finding hard numbers in primary sources and government data."
+        ),
+    ),
+    ResearchSpecialist(
+        name="Technology Researcher",
+        role="Technology and Use-Case Specialist",
+        focus="key use cases and recent developments",
+        backstory=(
+            "You are a former investigative journalist known for your ability to uncover "
+            "technology breakthroughs and market insights. With years of experience, you "
+            "excel at identifying actionable data and trends."
+        ),
+    ),
+    ResearchSpecialist(
+        name="Policy Researcher",
+        role="Regulation and Risk Specialist",
+        focus="challenges, risks, and regulation",
+        backstory=(
+            "You are a former policy analyst who follows legislation, regulatory action, and "
+            "emerging risks. You excel at explaining how rules and headwinds shape a market."
+        ),
+    ),
 )
-logger = logging.getLogger(__name__)
+MAX_PARALLEL_AGENTS: int = 3
+
+# Model used by each agent, keyed by agent name. Only the report writer needs
+# GPT-4o; research, analysis, and proofreading run on the cheaper, faster mini
+ROLE_MODELS: Dict[str, str] = {
+    **{specialist.name: GPT_4O_MINI_MODEL for specialist in RESEARCH_SPECIALISTS},
+    "Trend Analyst": GPT_4O_MINI_MODEL,
+    "Report Writer": GPT_4O_MODEL,
+    "Proofreader": GPT_4O_MINI_MODEL,
+}
+
+# Crews run their agents one after another, so each in-flight kickoff holds at
+# most one OpenAI request; bounding kickoffs bounds concurrent LLM calls.
+# Overridable with the OPENAI_MAX_CONCURRENCY environment variable (or .env)
+DEFAULT_OPENAI_MAX_CONCURRENCY: int = 8
+# Retries (with exponential backoff) LiteLLM applies to rate-limited or failed calls
+OPENAI_NUM_RETRIES: int = 5
+_LLM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+BRAVE_SEARCH_URL: str = "https://api.search.brave.com/res/v1/web/search"
+BRAVE_RESULT_COUNT: int = 3
+BRAVE_TIMEOUT_SECONDS: float = 10.0
+# Overridable with the BRAVE_MAX_CONCURRENCY environment variable (or .env)
+DEFAULT_BRAVE_MAX_CONCURRENCY: int = 4
+# Rate-limited (429), 5xx and transport failures are retried with jittered backoff
+BRAVE_MAX_ATTEMPTS: int = 5
+BRAVE_BACKOFF_BASE_SECONDS: float = 0.5
+BRAVE_BACKOFF_MAX_SECONDS: float = 30.0
+
+# Emails are sent off the main thread; pending sends are flushed at exit
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email")
+atexit.register(_EMAIL_EXECUTOR.shutdown, wait=True)
+
+
+class _EmailJob(NamedTuple):
+    """A report email waiting for the email thread."""
 
-load_dotenv()
-receiver_email: Optional[str] = os.getenv('RECEIVER_EMAIL')
+    to_email: Optional[str]
+    subject: str
+    body: str
+    pdf_path: str
+    future: "Future[None]"
 
+
+# Emails queued for the email thread, which sends them over one SMTP session
+_EMAIL_QUEUE: "queue.SimpleQueue[_EmailJob]" = queue.SimpleQueue()
+
+# Recent search results keyed by normalized query: (monotonic timestamp, result)
+_SEARCH_CACHE: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+_SEARCH_TTL: float = 600.0
+_SEARCH_CACHE_MAX_ENTRIES: int = 128
+
+def _init() -> None:
+    """Configure logging and load ``.env`` for command-line runs.
+    
+    Kept out of module import so that importers (tests, a serving layer)
+    neither pay for parsing ``.env`` nor have their logging configuration
+    overridden.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    load_dotenv()
+
+
+def _today() -> str:
+    """Return today's date in ISO format, used as the reports' ``as_of`` date."""
+    return date.today().isoformat()
+
+
+@functools.lru_cache(maxsize=1)
+def _crewai() -> Any:
+    """Import crewai on first use.
+    
+    Returns:
+        The ``crewai`` module.
+    """
+    import crewai  # pyright: ignore[reportMissingImports]
+    return crewai
+
+
+@functools.lru_cache(maxsize=1)
 def ensure_openai_api_key() -> str:
     """Ensure OpenAI API key is set in environment variables.
     
-    Loads environment variables from .env file and checks for OPENAI_API_KEY.
+    Reads OPENAI_API_KEY from the environment (populated from ``.env`` by
+    ``_init()`` on command-line runs). The result is cached, so the lookup
+    only happens once no matter how many LLM instances are created.
     
     Returns:
         str: The OpenAI API key if found.
@@ -48,7 +198,6 @@ def ensure_openai_api_key() -> str:
         >>> isinstance(api_key, str)
         True
     """
-    load_dotenv()
     openai_api_key: Optional[str] = os.getenv('OPENAI_API_KEY')
     
     if not openai_api_key:
@@ -60,11 +209,18 @@ def ensure_openai_api_key() -> str:
     return openai_api_key
 
 
-def create_llm_gpt_4o() -> LLM:  # type: ignore[name-defined]
-    """Create and configure the LLM instance.
+@functools.lru_cache(maxsize=4)
+def get_llm(model: str = GPT_4O_MINI_MODEL) -> LLM:  # type: ignore[name-defined]
+    """Return the shared LLM instance for ``model``.
+    
+    Instances are cached per model, so every agent, crew, and repeated
+    ``main()`` call in the same process reuses one LLM (and its underlying
+    HTTP client) instead of building a new one. Rate-limited calls are
+    retried with exponential backoff by LiteLLM up to ``OPENAI_NUM_RETRIES``
+    times.
     
-    Creates an LLM instance using OpenAI's GPT-4o model with the API key
-    from environment variables.
+    Args:
+        model: LiteLLM model identifier, e.g. ``openai/gpt-4o``.
     
     Returns:
         LLM: Configured LLM instance for use by agents.
@@ -73,49 +229,238 @@ def create_llm_gpt_4o() -> LLM:  # type: ignore[name-defined]
         ValueError: If OpenAI API key is not available.
         
     Example:
-        >>> llm = create_llm()
-        >>> llm is not None
+        >>> get_llm(GPT_4O_MODEL) is get_llm(GPT_4O_MODEL)
         True
     """
     try:
         api_key = ensure_openai_api_key()
-        llm = LLM(
-            model='openai/gpt-4o',
-            api_key=api_key
+        llm = _crewai().LLM(
+            model=model,
+            api_key=api_key,
+            num_retries=OPENAI_NUM_RETRIES
         )
-        logger.info("LLM instance created successfully with model: openai/gpt-4o")
+        logger.info(f"LLM instance created successfully with model: {model}")
         return llm
     except ValueError as e:
         logger.error(f"Failed to create LLM instance: {e}")
         raise
 
-# create llm with gpt 3.5 turbo
-def create_llm_gpt_3_5_turbo() -> LLM:
-    """Create and configure the LLM instance.
+
+def llm_for(agent_name: str) -> LLM:
+    """Return the shared LLM configured for ``agent_name`` in ``ROLE_MODELS``.
+    
+    Agents mapped to the same model share one instance through ``get_llm``.
+    
+    Args:
+        agent_name: Name of the agent, as used in ``ROLE_MODELS``.
+        
+    Returns:
+        LLM: Configured LLM instance for the agent.
+        
+    Raises:
+        KeyError: If ``agent_name`` has no entry in ``ROLE_MODELS``.
+        ValueError: If OpenAI API key is not available.
+    """
+    return get_llm(ROLE_MODELS[agent_name])
+
+
+def _get_brave_api_key() -> str:
+    """Read BRAVE_API_KEY, warning when the placeholder default is used.
+    
+    Returns:
+        str: The configured Brave API key, or the ``BRAVE-API-KEY`` placeholder.
+    """
+    brave_api_key: str = os.getenv("BRAVE_API_KEY", "BRAVE-API-KEY")
+    
+    if brave_api_key == "BRAVE-API-KEY":
+        logger.warning("Using default BRAVE_API_KEY value. Set BRAVE_API_KEY in environment for actual searches.")
+    
+    return brave_api_key
+
+
+@functools.lru_cache(maxsize=1)
+def _get_brave_client() -> httpx.Client:
+    """Build the keep-alive Brave HTTP client once and reuse it for every query.
     
-    Creates an LLM instance using OpenAI's GPT-3.5 Turbo model with the API key
-    from environment variables.
+    The client is closed at interpreter exit.
     
     Returns:
-        LLM: Configured LLM instance for use by agents.
+        httpx.Client: Shared client preconfigured with the Brave auth headers.
     """
-    api_key = ensure_openai_api_key()
-    llm = LLM(
-        model='openai/gpt-3.5-turbo',
-        api_key=api_key
+    import httpx
+
+    client = httpx.Client(
+        headers={
+            "Accept": "application/json",
+            "X-Subscription-Token": _get_brave_api_key(),
+        },
+        timeout=BRAVE_TIMEOUT_SECONDS
     )
-    return llm
+    atexit.register(client.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def _get_brave_semaphore() -> threading.BoundedSemaphore:
+    """Return the semaphore bounding concurrent Brave requests.
+    
+    Created on first use, after ``_init()`` has loaded ``.env``, and sized
+    by ``BRAVE_MAX_CONCURRENCY``.
+    """
+    return threading.BoundedSemaphore(
+        _env_limit("BRAVE_MAX_CONCURRENCY", DEFAULT_BRAVE_MAX_CONCURRENCY)
+    )
+
+
+def _brave_get(query: str) -> httpx.Response:
+    """Fetch Brave web results for ``query``, retrying transient failures.
+    
+    At most ``BRAVE_MAX_CONCURRENCY`` requests are in flight at once. Rate
+    limits (429), server errors and transport errors are retried up to
+    ``BRAVE_MAX_ATTEMPTS`` times with full-jitter exponential backoff, so
+    concurrent agents do not retry in lockstep and overshoot the quota again.
+    
+    Args:
+        query: Search query string.
+        
+    Returns:
+        httpx.Response: Successful response from the Brave API.
+        
+    Raises:
+        httpx.HTTPError: If the request still fails after the last attempt,
+            or fails with a non-retryable status.
+    """
+    import httpx
+
+    attempt = 1
+    while True:
+        try:
+            with _get_brave_semaphore():
+                response = _get_brave_client().get(
+                    BRAVE_SEARCH_URL,
+                    params={"q": query, "count": BRAVE_RESULT_COUNT}
+                )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if attempt >= BRAVE_MAX_ATTEMPTS or (status != 429 and status < 500):
+                raise
+            reason = f"HTTP {status}"
+        except httpx.TransportError as e:
+            if attempt >= BRAVE_MAX_ATTEMPTS:
+                raise
+            reason = type(e).__name__
+
+        delay = random.uniform(
+            0, min(BRAVE_BACKOFF_MAX_SECONDS, BRAVE_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+        )
+        logger.warning(
+            f"BraveSearch attempt {attempt} for query '{query}' failed ({reason}); retrying in {delay:.1f}s"
+        )
+        time.sleep(delay)
+        attempt += 1
+
+
+def _env_limit(name: str, default: int) -> int:
+    """Read a positive integer limit from the environment variable ``name``.
+    
+    Read at use time rather than import, so values loaded from ``.env`` by
+    ``_init()`` apply.
+    
+    Args:
+        name: Environment variable to read.
+        default: Value used when the variable is unset or invalid.
+        
+    Returns:
+        int: The configured limit, or ``default``.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}")
+        return default
+    return value
+
+
+def _get_loop_semaphore(
+    semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]",
+    env_var: str,
+    default: int
+) -> asyncio.Semaphore:
+    """Return the semaphore in ``semaphores`` for the running event loop.
+    
+    asyncio primitives are bound to the loop that first uses them, so one
+    semaphore is kept per loop, sized by ``env_var`` when it is created.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_env_limit(env_var, default))
+        semaphores[loop] = semaphore
+    return semaphore
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a search query into its cache key."""
+    return query.strip().lower()
+
+
+def _get_cached_search(query: str) -> Optional[str]:
+    """Return a cached search result for ``query`` if it is younger than ``_SEARCH_TTL``.
+    
+    Args:
+        query: Search query string.
+        
+    Returns:
+        The cached result, or None on a miss or an expired entry.
+    """
+    key = _normalize_query(query)
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= _SEARCH_TTL:
+            del _SEARCH_CACHE[key]
+            return None
+        _SEARCH_CACHE.move_to_end(key)
+        return entry[1]
+
+
+def _store_search(query: str, result: str) -> None:
+    """Cache a search result, evicting the least recently used entry when full.
+    
+    Args:
+        query: Search query string.
+        result: Search result to cache.
+    """
+    key = _normalize_query(query)
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (time.monotonic(), result)
+        _SEARCH_CACHE.move_to_end(key)
+        if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX_ENTRIES:
+            _SEARCH_CACHE.popitem(last=False)
+
 
 def brave_search_wrapper(query: str) -> str:
     """Wrapper function for BraveSearch tool.
     
     Executes a web search using BraveSearch API and returns relevant results.
+    Requests go over a shared keep-alive client and transient failures are
+    retried (see ``_brave_get``). Results are cached in memory for
+    ``_SEARCH_TTL`` seconds, so agents repeating a query within a run do not
+    hit the API again.
     
     Args:
         query: Search query string (must be non-empty).
         
     Returns:
-        Search results as a string.
+        JSON-encoded list of results with ``title``, ``link``, and ``snippet`` keys.
         
     Raises:
         ValueError: If query is not a non-empty string.
@@ -131,20 +476,25 @@ def brave_search_wrapper(query: str) -> str:
         logger.error(error_msg)
         raise ValueError(error_msg)
 
+    cached = _get_cached_search(query)
+    if cached is not None:
+        logger.info(f"BraveSearch cache hit for query: {query}")
+        return cached
+
     try:
-        brave_api_key: str = os.getenv("BRAVE_API_KEY", "BRAVE-API-KEY")
-        
-        if brave_api_key == "BRAVE-API-KEY":
-            logger.warning("Using default BRAVE_API_KEY value. Set BRAVE_API_KEY in environment for actual searches.")
-        
-        brave_search = BraveSearch.from_api_key(
-            api_key=brave_api_key,
-            search_kwargs={"count": 3}
-        )
-        
         logger.info(f"Executing BraveSearch query: {query}")
-        result = brave_search.run(query)
+        response = _brave_get(query)
+        results = [
+            {
+                "title": item.get("title", ""),
+                "link": item.get("url", ""),
+                "snippet": item.get("description", ""),
+            }
+            for item in response.json().get("web", {}).get("results", [])
+        ]
+        result = json.dumps(results)
         logger.info(f"BraveSearch completed for query: {query}")
+        _store_search(query, result)
         return result
         
     except Exception as e:
@@ -168,215 +518,658 @@ def create_brave_search_tool() -> Dict[str, Any]:
     }
 
 
-def main() -> None:
-    """Main execution function for the report generation pipeline.
+def log_agent_step(step: Any) -> None:
+    """Log an intermediate agent step at DEBUG level.
     
-    Initializes agents, creates tasks, executes the crew workflow,
-    and saves the final report to a PDF file.
+    Replaces CrewAI's ``verbose=True`` console output, which prints every
+    step synchronously. The %-style argument is only formatted when DEBUG
+    logging is enabled, so at the default INFO level this is a no-op.
     
-    Raises:
-        ValueError: If required API keys are not configured.
-        RuntimeError: If report generation or PDF creation fails.
+    Args:
+        step: Agent step (action or final answer) reported by CrewAI.
     """
-    try:
-        # Initialize LLM
-        llm_gpt_4o = create_llm_gpt_4o()
-        llm_gpt_3_5 = create_llm_gpt_3_5_turbo()
-        
-        # (Temporarily disabled) Create the BraveSearch tool
-        # search_tool = create_brave_search_tool()
-        
-        # Define agents
-        web_researcher_agent = Agent(
-            name="Web Researcher",
-            role="Web Research Specialist",
-            goal=(
-                "To find the most recent, impactful, and relevant information about {topic}. "
-                "This includes identifying key use cases, challenges, and statistics to provide "
-                "a foundation for deeper analysis."
-            ),
-            backstory=(
-                "You are a former investigative journalist known for your ability to uncover "
-                "technology breakthroughs and market insights. With years of experience, you "
-                "excel at identifying actionable data and trends."
-            ),
-            tools=[],
-            llm=llm_gpt_3_5,
-            verbose=True
-        )
+    logger.debug("Agent step: %s", step)
 
-        trend_analyst_agent = Agent(
-            name="Trend Analyst",
-            role="Insight Synthesizer",
-            goal=(
-                "To analyze research findings, extract significant trends, and rank them by "
-                "industry impact, growth potential, and uniqueness. Provide actionable insights "
-                "for decision-makers."
-            ),
-            backstory=(
-                "You are a seasoned strategy consultant who transitioned into {topic} analysis. "
-                "With an eye for patterns, you specialize in translating raw data into clear, "
-                "actionable insights."
-            ),
-            tools=[],
-            llm=llm_gpt_3_5,
-            verbose=True
-        )
 
-        report_writer_agent = Agent(
-            name="Report Writer",
-            role="Narrative Architect",
-            goal=(
-                "To craft a detailed, professional report that communicates research findings "
-                "and analysis effectively. Focus on clarity, logical flow, and engagement."
-            ),
-            backstory=(
-                "Once a technical writer for a renowned journal, you are now dedicated to "
-                "creating industry-leading reports. You blend storytelling with data to ensure "
-                "your work is both informative and captivating."
-            ),
-            tools=[],
-            llm=llm_gpt_4o,
-            verbose=True
-        )
+def log_task_output(task_output: TaskOutput) -> None:
+    """Log a task's output as soon as the task completes.
+    
+    Used as the crews' ``task_callback`` so intermediate results (research
+    findings, trend analysis, draft) are visible while later stages are
+    still running, instead of only after the whole pipeline finishes.
+    
+    Args:
+        task_output: Output of the task that just finished.
+    """
+    logger.info(f"{task_output.agent} finished a task: {task_output.summary}")
+    logger.debug("Full task output:\n%s", task_output.raw)
 
-        proofreader_agent = Agent(
-            name="Proofreader",
-            role="Polisher of Excellence",
-            goal=(
-                "To refine the report for grammatical accuracy, readability, and formatting, "
-                "ensuring it meets professional publication standards."
-            ),
-            backstory=(
-                "An award-winning editor turned proofreader, you specialize in perfecting "
-                "written content. Your sharp eye for detail ensures every document is flawless."
-            ),
-            tools=[],
-            llm=llm_gpt_4o,
-            verbose=True
-        )
 
-        manager_agent = Agent(
-            name="Manager",
-            role="Workflow Maestro",
-            goal=(
-                "To coordinate agents, manage task dependencies, and ensure all outputs meet "
-                "quality standards. Your focus is on delivering a cohesive final product through "
-                "efficient task management."
-            ),
-            backstory=(
-                "A former project manager with a passion for efficient teamwork, you ensure "
-                "every process runs smoothly, overseeing tasks and verifying results."
-            ),
-            tools=[],
-            llm=llm_gpt_3_5,
-            verbose=True,
-            allow_delegation=True
-        )
+async def _kickoff(crew: Any) -> Any:
+    """Kick off ``crew`` once a slot under ``OPENAI_MAX_CONCURRENCY`` is free.
+    
+    Every crew in the process, across topics and research sub-crews, shares
+    one semaphore per event loop, so the fan-out never has more than
+    ``OPENAI_MAX_CONCURRENCY`` OpenAI requests in flight and does not stall
+    on 429 backoffs.
+    
+    Args:
+        crew: Crew to run.
+        
+    Returns:
+        CrewOutput: Output of the crew.
+    """
+    async with _get_loop_semaphore(
+        _LLM_SEMAPHORES, "OPENAI_MAX_CONCURRENCY", DEFAULT_OPENAI_MAX_CONCURRENCY
+    ):
+        return await crew.kickoff_async()
 
-        # Define tasks
-        web_research_task = Task(
-            description=(
-                "Conduct web-based research to identify 5-7 key insights about {topic} as of {as_of}. "
-                "Use only recent and credible sources (prefer last 6–12 months). Include the source URL "
-                "for every insight. Prefer primary sources, government/official stats, and reputable media."
-            ),
-            expected_output="A structured list of 5-7 insights with a short summary and a URL for each."
-        )
 
-        trend_analysis_task = Task(
-            description="Analyze the findings (with citations) and rank trends by importance and impact; flag any stale sources.",
-            expected_output="A table ranking trends by impact, with concise descriptions and source URLs."
-        )
+def create_web_researcher_agent(llm: LLM, specialist: ResearchSpecialist) -> Agent:
+    """Create a web research agent for one research specialty.
+    
+    A fresh agent is built for every research sub-crew so that concurrently
+    running crews never share agent state. The persona (role, backstory,
+    goal) is topic-independent, so the system prompt is byte-identical
+    across topics and runs and stays eligible for provider prompt caching;
+    the topic reaches the agent through its task description instead.
+    
+    Args:
+        llm: LLM backing the agent.
+        specialist: Persona and focus area of the agent.
+        
+    Returns:
+        Agent: Configured web research agent.
+    """
+    crewai = _crewai()
+
+    # (Temporarily disabled) Create the BraveSearch tool
+    # search_tool = create_brave_search_tool()
+    return crewai.Agent(
+        name=specialist.name,
+        role=specialist.role,
+        goal=(
+            "To find the most recent, impactful, and relevant information that provides a "
+            f"foundation for deeper analysis. Focus: {specialist.focus}."
+        ),
+        backstory=specialist.backstory,
+        tools=[],
+        llm=llm,
+        verbose=False
+    )
 
-        report_writing_task = Task(
-            description=(
-                "Draft a professional report on {topic} as of {as_of}. Include: Introduction, Trends Overview, "
-                "Analysis, Recommendations. Retain footnote-style citations for all referenced facts/figures."
-            ),
-            expected_output="A structured draft with clear flow and in-text or footnote citations."
-        )
 
-        proofreading_task = Task(
+async def run_research(topic: str, as_of: str) -> str:
+    """Research every focus area of ``topic`` concurrently.
+    
+    Each entry of ``RESEARCH_SPECIALISTS`` gets its own single-task crew. The crews
+    are started together with ``asyncio.gather`` and throttled by a semaphore
+    of ``MAX_PARALLEL_AGENTS``, so wall time tracks the slowest focus area
+    rather than the sum of all of them.
+    
+    Args:
+        topic: Topic to research.
+        as_of: Date the research should be current as of.
+        
+    Returns:
+        str: Findings of all successful focus areas, one section per focus.
+        
+    Raises:
+        RuntimeError: If every research crew fails.
+    """
+    crewai = _crewai()
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
+
+    async def research(specialist: ResearchSpecialist) -> str:
+        researcher = create_web_researcher_agent(llm_for(specialist.name), specialist)
+        research_task = crewai.Task(
             description=(
-                "Edit the report draft for grammar, style, and flow. Return the full edited report text — "
-                "not a summary or placeholder. Ensure nothing from the original report is omitted."
+                "Conduct web-based research to identify 3-4 key insights. Use only recent and credible "
+                "sources (prefer last 6–12 months). Include the source URL for every insight. Prefer "
+                "primary sources, government/official stats, and reputable media.\n\n"
+                f"Topic: {topic}\nAs of: {as_of}\nFocus: {specialist.focus}"
             ),
-            expected_output=(
-                "The complete, polished report with all sections intact and improved readability."
-            )
+            expected_output="A structured list of 3-4 insights with a short summary and a URL for each.",
+            agent=researcher
         )
-
-        # Create crew
-        crew = Crew(
-            agents=[
-                web_researcher_agent,
-                trend_analyst_agent,
-                report_writer_agent,
-                proofreader_agent
-            ],
-            tasks=[
-                web_research_task,
-                trend_analysis_task,
-                report_writing_task,
-                proofreading_task
-            ],
-            process=Process.hierarchical,
-            manager_agent=manager_agent,
-            verbose=True
+        crew = crewai.Crew(
+            agents=[researcher],
+            tasks=[research_task],
+            process=crewai.Process.sequential,
+            step_callback=log_agent_step,
+            task_callback=log_task_output,
+            verbose=False
         )
+        async with semaphore:
+            logger.info(f"{specialist.name} researching {topic}: {specialist.focus}")
+            crew_output = await _kickoff(crew)
+        return f"## {specialist.focus.capitalize()}\n\n{crew_output.raw}"
 
-        # Execute crew workflow
-        logger.info("Starting crew workflow...")
-        topic = "NYC Real Estate Market"
-        logger.info(f"Processing topic: {topic}")
-        
-        crew_output = crew.kickoff(inputs={"topic": topic, "as_of": as_of})
+    results = await asyncio.gather(
+        *(research(specialist) for specialist in RESEARCH_SPECIALISTS),
+        return_exceptions=True
+    )
+
+    findings: List[str] = []
+    for specialist, result in zip(RESEARCH_SPECIALISTS, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Research on '{specialist.focus}' failed: {result}")
+        else:
+            findings.append(result)
+
+    if not findings:
+        raise RuntimeError(f"All research crews failed for topic: {topic}")
+
+    return "\n\n".join(findings)
 
-        # Extract final output
-        logger.info("Extracting final report...")
-        report_text: Optional[str] = None
+
+async def run_crew(topic: str, as_of: str) -> str:
+    """Run the agent pipeline for ``topic`` and return the report text.
+    
+    Research runs first as a concurrent fan-out (see ``run_research``); the
+    combined findings are then analyzed, written up, and proofread by a
+    sequential crew, since each of those steps depends on the previous one.
+    The task order is fixed, so no manager agent is needed to delegate.
+    
+    Topic, date, and findings are rendered into the prompts when the agents
+    and tasks are built, so crews are kicked off without ``inputs`` and
+    CrewAI has nothing left to interpolate. Each agent's model comes from
+    ``ROLE_MODELS``.
+    
+    Args:
+        topic: Topic to research and report on.
+        as_of: Date the report should be current as of.
         
-        try:
-            report_text = crew_output.raw[0].final_output
-        except (AttributeError, IndexError, KeyError) as e:
-            logger.warning(f"Could not extract from raw output: {e}, trying string conversion")
-            try:
-                report_text = str(crew_output)
-            except Exception as e:
-                logger.error(f"Failed to convert crew output to string: {e}")
-                report_text = ""
+    Returns:
+        str: The final report text produced by the crew.
+        
+    Raises:
+        RuntimeError: If research fails or no report text can be extracted from the crew output.
+    """
+    crewai = _crewai()
+    research_findings = await run_research(topic, as_of)
+
+    # Define agents
+    trend_analyst_agent = crewai.Agent(
+        name="Trend Analyst",
+        role="Insight Synthesizer",
+        goal=(
+            "To analyze research findings, extract significant trends, and rank them by "
+            "industry impact, growth potential, and uniqueness. Provide actionable insights "
+            "for decision-makers."
+        ),
+        backstory=(
+            "You are a seasoned strategy consultant who transitioned into market and industry "
+            "analysis. With an eye for patterns, you specialize in translating raw data into "
+            "clear, actionable insights."
+        ),
+        tools=[],
+        llm=llm_for("Trend Analyst"),
+        verbose=False
+    )
+
+    report_writer_agent = crewai.Agent(
+        name="Report Writer",
+        role="Narrative Architect",
+        goal=(
+            "To craft a detailed, professional report that communicates research findings "
+            "and analysis effectively. Focus on clarity, logical flow, and engagement."
+        ),
+        backstory=(
+            "Once a technical writer for a renowned journal, you are now dedicated to "
+            "creating industry-leading reports. You blend storytelling with data to ensure "
+            "your work is both informative and captivating."
+        ),
+        tools=[],
+        llm=llm_for("Report Writer"),
+        verbose=False
+    )
+
+    proofreader_agent = crewai.Agent(
+        name="Proofreader",
+        role="Polisher of Excellence",
+        goal=(
+            "To refine the report for grammatical accuracy, readability, and formatting, "
+            "ensuring it meets professional publication standards."
+        ),
+        backstory=(
+            "An award-winning editor turned proofreader, you specialize in perfecting "
+            "written content. Your sharp eye for detail ensures every document is flawless."
+        ),
+        tools=[],
+        llm=llm_for("Proofreader"),
+        verbose=False
+    )
+
+    # Define tasks
+    trend_analysis_task = crewai.Task(
+        description=(
+            "Analyze the following research findings (with citations) and rank trends by importance "
+            "and impact; flag any stale sources.\n\n"
+            f"Topic: {topic}\n\n{research_findings}"
+        ),
+        expected_output="A table ranking trends by impact, with concise descriptions and source URLs.",
+        agent=trend_analyst_agent
+    )
+
+    report_writing_task = crewai.Task(
+        description=(
+            "Draft a professional report. Include: Introduction, Trends Overview, Analysis, "
+            "Recommendations. Retain footnote-style citations for all referenced facts/figures.\n\n"
+            f"Topic: {topic}\nAs of: {as_of}"
+        ),
+        expected_output="A structured draft with clear flow and in-text or footnote citations.",
+        agent=report_writer_agent
+    )
+
+    proofreading_task = crewai.Task(
+        description=(
+            "Edit the report draft for grammar, style, and flow. Return the full edited report text — "
+            "not a summary or placeholder. Ensure nothing from the original report is omitted."
+        ),
+        expected_output=(
+            "The complete, polished report with all sections intact and improved readability."
+        ),
+        agent=proofreader_agent
+    )
+
+    # Create crew
+    crew = crewai.Crew(
+        agents=[
+            trend_analyst_agent,
+            report_writer_agent,
+            proofreader_agent
+        ],
+        tasks=[
+            trend_analysis_task,
+            report_writing_task,
+            proofreading_task
+        ],
+        process=crewai.Process.sequential,
+        step_callback=log_agent_step,
+        task_callback=log_task_output,
+        verbose=False
+    )
+
+    # Execute crew workflow
+    logger.info("Starting crew workflow...")
+    crew_output = await _kickoff(crew)
+
+    # Extract final output: the proofreading task is last, so its raw text is the report
+    logger.info("Extracting final report...")
+    report_text = crew_output.tasks_output[-1].raw if crew_output.tasks_output else ""
 
-        if not report_text:
-            raise RuntimeError("Failed to extract report text from crew output")
+    if not report_text:
+        raise RuntimeError("Failed to extract report text from crew output")
 
-        header = f"# {topic} — Report\n\nLast updated: {as_of}\n\n"
-        print("Header: ", header)
+    return report_text
 
-        report_text = header + report_text
+
+async def generate_report_text(topic: str, as_of: str, cache_dir: Path) -> str:
+    """Return the report text for ``topic``, running the crew only on a cache miss.
+    
+    Args:
+        topic: Topic to research and report on.
+        as_of: Date the report should be current as of.
+        cache_dir: Directory of the on-disk report cache.
         
-        logger.info("Report text extracted successfully")
+    Returns:
+        str: Report text for ``topic`` (without the title header).
+        
+    Raises:
+        RuntimeError: If the crew fails to produce report text.
+    """
+    cache_key = make_cache_key(
+        topic=topic,
+        as_of=as_of,
+        models=ROLE_MODELS
+    )
+    report_text: Optional[str] = load_cached_report(str(cache_dir), cache_key)
+
+    if report_text is not None:
+        logger.info(f"Using cached report text for topic: {topic}")
+        return report_text
+
+    report_text = await run_crew(topic, as_of)
+    try:
+        store_cached_report(str(cache_dir), cache_key, report_text)
+    except OSError as e:
+        logger.warning(f"Failed to cache report text: {e}")
+    return report_text
 
-        # Save to PDF
-        current_dir = Path(__file__).parent
-        outputs_dir = current_dir / "outputs"
-        pdf_path = outputs_dir / "final_report.pdf"
+
+async def generate_reports(
+    topics: List[str],
+    as_of: str,
+    cache_dir: Path,
+    outputs_dir: Path
+) -> Tuple[Dict[str, str], Dict[str, BaseException], Dict[str, Exception]]:
+    """Generate and publish reports for several topics concurrently.
+    
+    Topics are dispatched together and throttled by a semaphore of
+    ``MAX_PARALLEL_TOPICS`` to stay within OpenAI rate limits. Each topic's
+    PDF is rendered on a worker thread as soon as its text is ready, so
+    rendering overlaps with the crews still running for other topics. A
+    topic whose generation fails is logged and reported back rather than
+    discarding the others; a topic whose PDF or email fails to publish keeps
+    its report text.
+    
+    Args:
+        topics: Topics to report on; repeated topics are reported once.
+        as_of: Date the reports should be current as of.
+        cache_dir: Directory of the on-disk report cache.
+        outputs_dir: Directory the PDFs are written to.
+        
+    Returns:
+        Tuple of the report text keyed by topic, in input order, the
+        generation error keyed by topic for every topic that produced no
+        report, and the publishing error keyed by topic for every report
+        that failed to publish.
         
-        logger.info(f"Saving PDF to: {pdf_path}")
-        saved_path = save_report_to_pdf(report_text, str(pdf_path))
-        print(f"\nSaved PDF to: {saved_path}")
+    Raises:
+        RuntimeError: If no topic produced a report.
+    """
+    publish_errors: Dict[str, Exception] = {}
+    # Repeated topics would race on the same PDF and cache entry
+    topics = list(dict.fromkeys(topics))
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_TOPICS)
+    single = len(topics) == 1
 
-        # === Email the final PDF ===
+    async def generate(topic: str) -> str:
+        async with semaphore:
+            logger.info(f"Processing topic: {topic}")
+            report_text = await generate_report_text(topic, as_of, cache_dir)
+        # Render outside the semaphore so the next topic's crew can start
         try:
-            to_email = receiver_email
-            subject = "Automated Research Report"
-            body = "Hello,\n\nPlease find attached the latest research report generated by the multi-agent workflow.\n\nBest regards,\nYour AI Assistant"
-            send_email_with_attachment(to_email, subject, body, str(saved_path))
-            logger.info(f"Email sent successfully to {to_email}")
+            await asyncio.to_thread(
+                publish_report, topic, report_text, as_of, _pdf_path(topic, outputs_dir, single)
+            )
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
+            logger.error(f"Publishing the report failed for topic '{topic}': {e}")
+            publish_errors[topic] = e
+        return report_text
+
+    results = await asyncio.gather(*(generate(topic) for topic in topics), return_exceptions=True)
+
+    reports: Dict[str, str] = {}
+    generation_errors: Dict[str, BaseException] = {}
+    for topic, result in zip(topics, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Report generation failed for topic '{topic}': {result}")
+            generation_errors[topic] = result
+        else:
+            reports[topic] = result
 
+    if not reports:
+        raise RuntimeError("Report generation failed for every topic")
+
+    return reports, generation_errors, publish_errors
+
+
+def _log_email_result(to_email: Optional[str], future: "Future[None]") -> None:
+    """Log the outcome of a background email send.
+    
+    Args:
+        to_email: Recipient of the email.
+        future: Completed send future.
+    """
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to send email: {error}")
+    else:
+        logger.info(f"Email sent successfully to {to_email}")
+
+
+def _next_email_job() -> Optional[_EmailJob]:
+    """Pop the next queued email, or return None if the queue is empty."""
+    try:
+        return _EMAIL_QUEUE.get_nowait()
+    except queue.Empty:
+        return None
+
+
+def _send_queued_emails() -> None:
+    """Send every queued email over a single SMTP session.
+    
+    Runs on the email thread. Emails queued while the session is open are
+    sent over it too, so a batch of reports pays for one connection,
+    STARTTLS handshake, and login. A run that finds the queue already
+    drained returns without connecting.
+    """
+    job = _next_email_job()
+    if job is None:
+        return
+
+    try:
+        with EmailSender() as sender:
+            while job is not None:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        sender.send(job.to_email, job.subject, job.body, job.pdf_path)
+                    except Exception as e:
+                        job.future.set_exception(e)
+                    else:
+                        job.future.set_result(None)
+                job = _next_email_job()
+    except Exception as e:
+        # Connecting or logging in failed: fail this email and every one still queued
+        while job is not None:
+            if not job.future.done():
+                job.future.set_exception(e)
+            job = _next_email_job()
+
+
+def email_report(topic: str, pdf_path: str) -> "Future[None]":
+    """Queue a generated report PDF for emailing on the background email thread.
+    
+    Returns immediately; the outcome is logged when the send completes, and
+    pending sends are flushed at interpreter exit. Reports queued together
+    share one SMTP session (see ``_send_queued_emails``).
+    
+    Args:
+        topic: Topic of the report, used in the subject line.
+        pdf_path: Path of the PDF to attach.
         
+    Returns:
+        Future[None]: Future of the send, for callers that want to wait on it.
+    """
+    to_email = os.getenv('RECEIVER_EMAIL')
+    subject = f"Automated Research Report: {topic}"
+    body = "Hello,\n\nPlease find attached the latest research report generated by the multi-agent workflow.\n\nBest regards,\nYour AI Assistant"
+    future: "Future[None]" = Future()
+    _EMAIL_QUEUE.put(_EmailJob(to_email, subject, body, pdf_path, future))
+    _EMAIL_EXECUTOR.submit(_send_queued_emails)
+    future.add_done_callback(functools.partial(_log_email_result, to_email))
+    return future
+
+
+def _slugify(text: str) -> str:
+    """Turn a topic into a filesystem-friendly slug.
+    
+    Example:
+        >>> _slugify("NYC Real Estate Market")
+        'nyc_real_estate_market'
+    """
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_") or "report"
+
+
+def save_last_output(path: Path, report_date: str, reports: Dict[str, str], single: bool) -> None:
+    """Persist the generated report text so it can be replayed later.
+    
+    Args:
+        path: JSON file to write.
+        report_date: ``as_of`` date the reports were generated for.
+        reports: Report text keyed by topic.
+        single: Whether the run was for a single topic, which decides the
+            PDF file names on replay.
+        
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.write_bytes(orjson.dumps({"as_of": report_date, "single": single, "reports": reports}))
+    logger.info(f"Saved report output to: {path}")
+
+
+def load_last_output(path: Path) -> Tuple[str, Dict[str, str], bool]:
+    """Load report text previously written by ``save_last_output``.
+    
+    Args:
+        path: JSON file to read.
+        
+    Returns:
+        Tuple[str, Dict[str, str], bool]: The ``as_of`` date, the report text
+        keyed by topic, and whether the run was for a single topic.
+        
+    Raises:
+        RuntimeError: If the file is missing, unreadable, or holds no reports.
+    """
+    try:
+        data = orjson.loads(path.read_bytes())
+    except FileNotFoundError as e:
+        raise RuntimeError(f"No saved output to replay at {path}; run without --replay first") from e
+    except (OSError, orjson.JSONDecodeError) as e:
+        raise RuntimeError(f"Failed to read saved output at {path}: {e}") from e
+
+    reports = data.get("reports")
+    if not isinstance(reports, dict) or not reports:
+        raise RuntimeError(f"Saved output at {path} contains no reports")
+
+    single = data.get("single")
+    if not isinstance(single, bool):
+        single = len(reports) == 1
+    return data.get("as_of") or _today(), reports, single
+
+
+def _pdf_path(topic: str, outputs_dir: Path, single: bool) -> Path:
+    """Return the PDF path for ``topic``.
+    
+    A single report keeps the historical ``final_report.pdf`` file name;
+    several reports are saved as ``<topic_slug>_<hash>_report.pdf``. The
+    short hash of the exact topic keeps topics that slugify alike (e.g.
+    ``AI/ML`` and ``AI ML``) from writing to the same file.
+    """
+    if single:
+        return outputs_dir / "final_report.pdf"
+    digest = hashlib.sha256(topic.encode("utf-8")).hexdigest()[:8]
+    return outputs_dir / f"{_slugify(topic)}_{digest}_report.pdf"
+
+
+def publish_report(topic: str, report_text: str, report_date: str, pdf_path: Path) -> str:
+    """Render one report to PDF and queue it for emailing.
+    
+    Args:
+        topic: Topic of the report.
+        report_text: Report body as markdown text.
+        report_date: Date shown in the report header.
+        pdf_path: Path the PDF is written to.
+        
+    Returns:
+        str: Path of the saved PDF.
+        
+    Raises:
+        OSError: If the PDF cannot be written.
+        RuntimeError: If PDF generation fails.
+    """
+    saved_path = save_report_to_pdf(
+        f"# {topic} — Report\n\nLast updated: {report_date}\n\n{report_text}",
+        str(pdf_path)
+    )
+    print(f"\nSaved PDF for '{topic}' to: {saved_path}")
+
+    # === Email the final PDF ===
+    # Queued on the background email thread so the SMTP round trip does not
+    # hold up the remaining renders
+    email_report(topic, saved_path)
+    return saved_path
+
+
+def publish_reports(reports: Dict[str, str], report_date: str, outputs_dir: Path, single: bool) -> None:
+    """Render every report to PDF in parallel and queue each for emailing.
+    
+    Args:
+        reports: Report text keyed by topic.
+        report_date: Date shown in each report header.
+        outputs_dir: Directory the PDFs are written to.
+        single: Whether the reports come from a single-topic run.
+        
+    Raises:
+        OSError: If a PDF cannot be written.
+        RuntimeError: If PDF generation fails.
+    """
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(
+                publish_report, topic, report_text, report_date, _pdf_path(topic, outputs_dir, single)
+            )
+            for topic, report_text in reports.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+
+def main(topics: Optional[List[str]] = None, replay: bool = False) -> None:
+    """Main execution function for the report generation pipeline.
+    
+    Generates the report text for every topic concurrently, rendering each
+    PDF as soon as its text is ready and emailing it in the background. Report text
+    for an unchanged topic/date/model combination is served from the
+    on-disk cache in ``outputs/.llm_cache`` instead of re-running the crew.
+    
+    The generated text is also saved to ``outputs/last_output.json``; with
+    ``replay=True`` that file is rendered and emailed again without running
+    the crew at all.
+    
+    Args:
+        topics: Topics to report on. Defaults to ``[DEFAULT_TOPIC]``.
+        replay: Re-publish the last saved output instead of generating reports.
+    
+    Raises:
+        ValueError: If required API keys are not configured.
+        RuntimeError: If report generation or PDF creation fails.
+    """
+    topics = topics or [DEFAULT_TOPIC]
+
+    try:
+        # Create the outputs directory once up front, before any concurrent writers
+        _OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+        cache_dir = _OUTPUTS_DIR / ".llm_cache"
+        last_output_path = _OUTPUTS_DIR / LAST_OUTPUT_FILENAME
+
+        if replay:
+            logger.info(f"Replaying saved output from: {last_output_path}")
+            report_date, reports, single = load_last_output(last_output_path)
+            publish_reports(reports, report_date, _OUTPUTS_DIR, single)
+        else:
+            # Initialize one LLM per model up front so a missing API key fails fast
+            for model in set(ROLE_MODELS.values()):
+                get_llm(model)
+
+            report_date = _today()
+            logger.info("Starting crew workflow...")
+            reports, generation_errors, publish_errors = asyncio.run(
+                generate_reports(topics, report_date, cache_dir, _OUTPUTS_DIR)
+            )
+            logger.info("Report text extracted successfully")
+
+            # Saved even when a topic failed, so --replay can retry this run's reports
+            # under the same PDF file names
+            single = len(reports) + len(generation_errors) == 1
+            try:
+                save_last_output(last_output_path, report_date, reports, single)
+            except OSError as e:
+                logger.warning(f"Failed to save report output for replay: {e}")
+
+            failures = []
+            if generation_errors:
+                failures.append(f"Failed to generate reports for: {', '.join(generation_errors)}")
+            if publish_errors:
+                failures.append(
+                    f"Failed to publish reports for: {', '.join(publish_errors)}; "
+                    "run with --replay to retry"
+                )
+            if failures:
+                raise RuntimeError(". ".join(failures))
+
     except ValueError as e:
         logger.error(f"Configuration error: {e}")
         raise
@@ -388,5 +1181,46 @@ def main() -> None:
         raise RuntimeError(f"Failed to generate report: {e}") from e
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments.
+    
+    Topics given on the command line take precedence over the
+    semicolon-separated ``REPORT_TOPICS`` environment variable, which in turn
+    takes precedence over ``DEFAULT_TOPIC``.
+    
+    Args:
+        argv: Argument list to parse. Defaults to ``sys.argv[1:]``.
+        
+    Returns:
+        argparse.Namespace: Parsed arguments with a non-empty ``topics`` list.
+        
+    Raises:
+        SystemExit: If topics are given together with ``--replay``.
+    """
+    parser = argparse.ArgumentParser(description="Generate research reports with a multi-agent crew.")
+    parser.add_argument(
+        "topics",
+        nargs="*",
+        help="Topics to report on (default: REPORT_TOPICS or the built-in topic)."
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help=f"Re-render and email outputs/{LAST_OUTPUT_FILENAME} without running the crew."
+    )
+    args = parser.parse_args(argv)
+
+    if args.replay and args.topics:
+        parser.error("--replay re-publishes the saved reports and does not take topics")
+
+    if not args.topics:
+        env_topics = os.getenv("REPORT_TOPICS", "")
+        args.topics = [t.strip() for t in env_topics.split(";") if t.strip()] or [DEFAULT_TOPIC]
+
+    return args
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    _init()
+    args = parse_args()
+    main(args.topics, replay=args.replay)
@@ -1,54 +1,142 @@
 # email_sender.py
 
+import base64
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email.mime.text import MIMEText
-from email import encoders
+from email.message import EmailMessage, MIMEPart
 import os
+from types import TracebackType
+from typing import Optional, Type
 from dotenv import load_dotenv
 
+# A multiple of 57 bytes, so each chunk encodes to whole 76-character base64 lines
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
 
-def send_email_with_attachment(to_email: str, subject: str, body: str, attachment_path: str) -> None:
-    """Send an email with a PDF attachment.
+
+def _encode_attachment(attachment_path: str) -> str:
+    """Base64-encode a file chunk by chunk.
+
+    The raw file is never held in memory in full; only the encoded payload
+    that goes into the message is.
 
     Args:
-        to_email: Recipient email address.
-        subject: Email subject line.
-        body: Plain text message body.
-        attachment_path: Path to the PDF file to attach.
+        attachment_path: Path to the file to encode.
+
+    Returns:
+        The file contents as MIME base64 text.
     """
+    encoded = []
+    with open(attachment_path, "rb") as f:
+        while chunk := f.read(ATTACHMENT_CHUNK_SIZE):
+            encoded.append(base64.encodebytes(chunk).decode("ascii"))
+    return "".join(encoded)
+
 
-    # Load credentials from .env file
-    load_dotenv()
-    smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-    smtp_port = int(os.getenv("SMTP_PORT", "587"))
-    sender_email = os.getenv("SENDER_EMAIL")
-    sender_password = os.getenv("SENDER_PASSWORD")
+class EmailSender:
+    """Authenticated SMTP connection reused for several emails.
 
-    if not sender_email or not sender_password:
-        raise ValueError("Email credentials not found. Set SENDER_EMAIL and SENDER_PASSWORD in your .env file")
+    The connection, STARTTLS handshake and login happen once on ``__enter__``;
+    every ``send`` inside the ``with`` block goes over the same session.
 
-    # Create the email
-    msg = MIMEMultipart()
-    msg["From"] = sender_email
-    msg["To"] = to_email
-    msg["Subject"] = subject
+    Example:
+        >>> with EmailSender() as sender:
+        ...     for path in pdf_paths:
+        ...         sender.send("team@example.com", "Report", "Attached.", path)
+    """
 
-    msg.attach(MIMEText(body, "plain"))
+    def __init__(self) -> None:
+        """Read the SMTP settings and credentials.
 
-    # Attach the file
-    with open(attachment_path, "rb") as f:
-        part = MIMEBase("application", "octet-stream")
-        part.set_payload(f.read())
-        encoders.encode_base64(part)
-        part.add_header("Content-Disposition", f'attachment; filename="{os.path.basename(attachment_path)}"')
+        Raises:
+            ValueError: If SENDER_EMAIL or SENDER_PASSWORD is not set.
+        """
+        # Load credentials from .env file
+        load_dotenv()
+        self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
+        self.sender_email = os.getenv("SENDER_EMAIL")
+        self.sender_password = os.getenv("SENDER_PASSWORD")
+
+        if not self.sender_email or not self.sender_password:
+            raise ValueError("Email credentials not found. Set SENDER_EMAIL and SENDER_PASSWORD in your .env file")
+
+        self.server: Optional[smtplib.SMTP] = None
+
+    def __enter__(self) -> "EmailSender":
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except BaseException:
+            server.close()
+            raise
+        self.server = server
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        server, self.server = self.server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except smtplib.SMTPServerDisconnected:
+            pass
+        finally:
+            server.close()
+
+    def send(self, to_email: str, subject: str, body: str, attachment_path: str) -> None:
+        """Send an email with a PDF attachment over the open connection.
+
+        Args:
+            to_email: Recipient email address.
+            subject: Email subject line.
+            body: Plain text message body.
+            attachment_path: Path to the PDF file to attach.
+
+        Raises:
+            RuntimeError: If called outside the ``with`` block.
+        """
+        if self.server is None:
+            raise RuntimeError("EmailSender.send must be called inside a 'with EmailSender()' block")
+
+        # Create the email
+        msg = EmailMessage()
+        msg["From"] = self.sender_email
+        msg["To"] = to_email
+        msg["Subject"] = subject
+        msg.set_content(body)
+
+        # Attach the file. The part is built from the chunk-encoded payload
+        # rather than add_attachment(), which needs the whole file in memory
+        part = MIMEPart()
+        part["Content-Type"] = "application/pdf"
+        part["Content-Transfer-Encoding"] = "base64"
+        part.add_header("Content-Disposition", "attachment", filename=os.path.basename(attachment_path))
+        part.set_payload(_encode_attachment(attachment_path))
+        msg.make_mixed()
         msg.attach(part)
 
-    # Send the email
-    with smtplib.SMTP(smtp_server, smtp_port) as server:
-        server.starttls()
-        server.login(sender_email, sender_password)
-        server.send_message(msg)
+        # Send the email
+        self.server.send_message(msg)
+
+        print(f"✅ Email with report sent successfully to {to_email}")
+
+
+def send_email_with_attachment(to_email: str, subject: str, body: str, attachment_path: str) -> None:
+    """Send a single email with a PDF attachment.
+
+    Opens a connection for this one message; use ``EmailSender`` directly
+    to send several emails over one connection.
 
-    print(f"✅ Email with report sent successfully to {to_email}")
+    Args:
+        to_email: Recipient email address.
+        subject: Email subject line.
+        body: Plain text message body.
+        attachment_path: Path to the PDF file to attach.
+    """
+    with EmailSender() as sender:
+        sender.send(to_email, subject, body, attachment_path)
@@ -1,58 +1,266 @@
-import re
+import functools
 import logging
 import os
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-def clean_text(content: str) -> str:
-    """Clean markdown formatting and special characters from text.
+# Inline markdown HTML mapped to the open/close tags ReportLab's Paragraph
+# understands; links are handled separately and any other inline tag (spans...)
+# is dropped, keeping its text
+_INLINE_TAGS = {
+    'strong': ('<b>', '</b>'),
+    'em': ('<i>', '</i>'),
+    'code': ('<font face="Courier">', '</font>'),
+    'sup': ('<super>', '</super>'),
+}
+
+# Block-level tags that start a new paragraph, and the paragraph kind they produce
+_BLOCK_KINDS = {
+    'h1': 'title',
+    'h2': 'heading', 'h3': 'heading', 'h4': 'heading', 'h5': 'heading', 'h6': 'heading',
+    'p': 'body',
+    'pre': 'body',
+}
+
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Output directories already created by this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+class _BlockCollector(HTMLParser):
+    """Collect ReportLab paragraphs from the HTML of a converted markdown document.
     
-    Removes markdown formatting markers (bold, italic), standalone asterisks,
-    and normalizes whitespace to prepare text for PDF generation.
+    Headings and paragraphs become one paragraph each. List items are
+    prefixed with a bullet, or their number inside ``<ol>``, and indented
+    by nesting depth. Table rows become one body paragraph with cells
+    separated by ``|``. Links keep their target, which is also printed
+    after the link text; footnote back-reference links are dropped.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.blocks: List[Tuple[str, str]] = []
+        # Open paragraph: kind, prefix (list marker) and inline markup parts
+        self._kind: Optional[str] = None
+        self._prefix = ''
+        self._parts: List[str] = []
+        # Item counter per open list; None for an unordered list
+        self._lists: List[Optional[int]] = []
+        self._row: Optional[List[str]] = None
+        self._in_pre = False
+        self._skip_depth = 0
+        # Open links: target URL, or None for in-document anchors, and the
+        # index of the link's first part
+        self._links: List[Tuple[Optional[str], int]] = []
+
+    def _open(self, kind: str, prefix: str = '') -> None:
+        self._flush()
+        self._kind, self._prefix = kind, prefix
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def _flush(self) -> None:
+        text = ''.join(self._parts).strip()
+        if self._kind is not None and text:
+            self.blocks.append((self._kind, f"{self._prefix}{text}"))
+        self._kind, self._prefix, self._parts = None, '', []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if self._skip_depth:
+            self._skip_depth += tag == 'a'
+            return
+        if tag == 'a' and 'footnote-backref' in (dict(attrs).get('class') or ''):
+            self._skip_depth = 1
+        elif tag == 'a':
+            href = dict(attrs).get('href') or ''
+            # Anchors such as footnote references have no destination in the PDF
+            url = None if not href or href.startswith('#') else href
+            self._links.append((url, len(self._parts)))
+            if url is not None:
+                escaped = url.translate(_XML_ESCAPE).replace('"', '&quot;')
+                self._parts.append(f'<a href="{escaped}">')
+        elif tag in _INLINE_TAGS:
+            self._parts.append(_INLINE_TAGS[tag][0])
+        elif tag == 'br':
+            self._parts.append('<br/>')
+        elif tag in ('ol', 'ul'):
+            self._flush()
+            self._lists.append(0 if tag == 'ol' else None)
+        elif tag == 'li':
+            marker = '\u2022'
+            if self._lists and self._lists[-1] is not None:
+                self._lists[-1] += 1
+                marker = f"{self._lists[-1]}."
+            indent = '&nbsp;' * 4 * max(len(self._lists) - 1, 0)
+            self._open('body', f"{indent}{marker} ")
+        elif tag == 'p' and self._kind is not None and not ''.join(self._parts).strip():
+            # First paragraph of a loose list item continues the item itself
+            pass
+        elif tag in _BLOCK_KINDS:
+            self._open(_BLOCK_KINDS[tag])
+            self._in_pre = tag == 'pre'
+        elif tag == 'tr':
+            self._flush()
+            self._row = []
+        elif tag in ('td', 'th'):
+            self._open('body')
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip_depth:
+            self._skip_depth -= tag == 'a'
+            return
+        if tag == 'a' and self._links:
+            url, start = self._links.pop()
+            if url is not None:
+                label = ''.join(self._parts[start + 1:]).strip()
+                self._parts.append('</a>')
+                escaped = url.translate(_XML_ESCAPE)
+                if label != escaped:
+                    self._parts.append(f" ({escaped})")
+        elif tag in _INLINE_TAGS:
+            self._parts.append(_INLINE_TAGS[tag][1])
+        elif tag in ('ol', 'ul'):
+            self._flush()
+            if self._lists:
+                self._lists.pop()
+        elif tag in ('td', 'th') and self._row is not None:
+            cell = ''.join(self._parts).strip()
+            self._row.append(f"<b>{cell}</b>" if tag == 'th' and cell else cell)
+            self._kind, self._parts = None, []
+        elif tag == 'tr' and self._row is not None:
+            if any(self._row):
+                self.blocks.append(('body', ' | '.join(self._row)))
+            self._row = None
+        elif tag in _BLOCK_KINDS or tag == 'li':
+            self._flush()
+            self._in_pre = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._kind is None:
+            if not data.strip():
+                return
+            # Loose text, e.g. an item's text after its nested list closed
+            self._kind = 'body'
+        text = data.translate(_XML_ESCAPE)
+        self._parts.append(text.replace('\n', '<br/>') if self._in_pre else text)
+
+
+def _markdown_to_html(markdown: Any, text: str) -> str:
+    """Convert markdown to HTML, escaping any raw HTML in the source.
+    
+    Python-Markdown passes raw HTML through unchanged, and a stray or
+    unbalanced tag in LLM output would make ReportLab reject the whole
+    document. With the raw HTML block and inline handlers removed, such
+    tags are kept as literal text.
+    
+    Args:
+        markdown: The imported ``markdown`` module.
+        text: Markdown source.
+        
+    Returns:
+        str: Converted HTML.
+    """
+    md = markdown.Markdown(extensions=['extra'])
+    md.preprocessors.deregister('html_block')
+    md.inlinePatterns.deregister('html')
+    return md.convert(text)
+
+
+def _iter_blocks(html: str) -> List[Tuple[str, str]]:
+    """Split converted markdown into paragraph-level blocks.
     
     Args:
-        content: Raw text content that may contain markdown formatting.
+        html: HTML produced by ``markdown.markdown``.
         
     Returns:
-        Cleaned text without markdown markers and normalized whitespace.
+        List[Tuple[str, str]]: The block kind (``'title'``, ``'heading'`` or ``'body'``)
+        and its inline markup, ready to pass to ReportLab's ``Paragraph``.
         
     Example:
-        >>> clean_text("**Bold** and *italic* text")
-        'Bold and italic text'
-        >>> clean_text("Text with  *  asterisks")
-        'Text with asterisks'
+        >>> _iter_blocks("<h2>Trends</h2>\\n<p><strong>Rents</strong> rose</p>")
+        [('heading', 'Trends'), ('body', '<b>Rents</b> rose')]
+        >>> _iter_blocks("<ol><li>First</li><li>Second</li></ol>")
+        [('body', '1. First'), ('body', '2. Second')]
+        >>> _iter_blocks('<p>See <a href="https://example.com/?a=1&amp;b=2">the data</a></p>')
+        [('body', 'See <a href="https://example.com/?a=1&amp;b=2">the data</a> (https://example.com/?a=1&amp;b=2)')]
     """
-    if not content:
-        return ""
-    
-    # Remove markdown bold/italic markers (**text** or *text*)
-    content = re.sub(r'\*\*([^*]+)\*\*', r'\1', content)  # Remove **bold**
-    content = re.sub(r'\*([^*]+)\*', r'\1', content)  # Remove *italic*
-    content = re.sub(r'\*\s+', '', content)  # Remove standalone asterisks with spaces
+    collector = _BlockCollector()
+    collector.feed(html)
+    collector.close()
+    return collector.blocks
+
+
+@functools.lru_cache(maxsize=1)
+def _styles() -> Dict[str, Any]:
+    """Build the paragraph styles once and share them across PDFs.
     
-    # Replace multiple asterisks with empty string
-    content = re.sub(r'\*+', '', content)
+    Returns:
+        Dict mapping a paragraph kind (``'title'``, ``'heading'``, ``'body'``)
+        to its ReportLab ``ParagraphStyle``.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore[reportMissingImports]
+    from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY  # type: ignore[reportMissingImports]
+
+    # Define styles
+    styles = getSampleStyleSheet()
     
-    # Clean up multiple spaces
-    content = re.sub(r' +', ' ', content)
+    # Custom styles for better formatting. Gaps between paragraphs come from
+    # spaceAfter alone (the former 0.15" Spacer is folded in), so the story
+    # holds one flowable per paragraph. ReportLab only applies the part of a
+    # spaceBefore that exceeds the previous paragraph's spaceAfter, so the
+    # heading's spaceBefore of 29 keeps the former ~29pt gap above headings
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor='black',
+        spaceAfter=23,
+        alignment=TA_LEFT,
+        fontName='Helvetica-Bold'
+    )
     
-    # Clean up multiple newlines
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor='black',
+        spaceAfter=21,
+        spaceBefore=29,
+        alignment=TA_LEFT,
+        fontName='Helvetica-Bold'
+    )
     
-    return content.strip()
+    body_style = ParagraphStyle(
+        'CustomBody',
+        parent=styles['Normal'],
+        fontSize=11,
+        textColor='black',
+        spaceAfter=19,
+        alignment=TA_JUSTIFY,
+        fontName='Times-Roman',
+        leading=14
+    )
+
+    return {
+        'title': title_style,
+        'heading': heading_style,
+        'body': body_style,
+    }
 
 
 def save_report_to_pdf(text: str, file_path: str) -> str:
     """Save text content to a PDF file with proper formatting.
     
-    Creates a professionally formatted PDF document from text content,
-    cleaning markdown formatting and applying appropriate styles for
-    headings and body text.
+    Creates a professionally formatted PDF document from text content.
+    The markdown is converted to HTML in a single pass; headings map to
+    the title and heading styles, and bold/italic markup is kept inline.
     
     Args:
         text: Text content to convert to PDF (may contain markdown).
@@ -62,7 +270,7 @@ def save_report_to_pdf(text: str, file_path: str) -> str:
         Path to the saved PDF file.
         
     Raises:
-        ImportError: If reportlab package is not installed.
+        ImportError: If the reportlab or markdown package is not installed.
         OSError: If the output directory cannot be created or file cannot be written.
         
     Example:
@@ -74,21 +282,29 @@ def save_report_to_pdf(text: str, file_path: str) -> str:
     try:
         from reportlab.lib.pagesizes import LETTER  # type: ignore[reportMissingImports]
         from reportlab.lib.units import inch  # type: ignore[reportMissingImports]
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer  # type: ignore[reportMissingImports]
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore[reportMissingImports]
-        from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY  # type: ignore[reportMissingImports]
+        from reportlab.platypus import SimpleDocTemplate, Paragraph  # type: ignore[reportMissingImports]
     except ImportError as e:
         error_msg = "reportlab is required to export PDF. Install with: pip install reportlab"
         logger.error(f"{error_msg}: {e}")
         raise ImportError(error_msg) from e
 
     try:
-        output_dir = os.path.dirname(file_path) or "."
-        os.makedirs(output_dir, exist_ok=True)
+        import markdown  # type: ignore[reportMissingImports]
+    except ImportError as e:
+        error_msg = "markdown is required to export PDF. Install with: pip install markdown"
+        logger.error(f"{error_msg}: {e}")
+        raise ImportError(error_msg) from e
+
+    output_dir = os.path.dirname(file_path) or "."
+    try:
+        # Only hit the filesystem the first time a directory is seen
+        if output_dir not in _ENSURED_DIRS:
+            os.makedirs(output_dir, exist_ok=True)
+            _ENSURED_DIRS.add(output_dir)
         logger.info(f"Creating PDF at: {file_path}")
         
-        # Clean the text content
-        cleaned_text = clean_text(text)
+        # Convert the markdown once; ReportLab renders the inline tags directly
+        html = _markdown_to_html(markdown, text)
 
         # Create the PDF document
         doc = SimpleDocTemplate(
@@ -100,74 +316,13 @@ def save_report_to_pdf(text: str, file_path: str) -> str:
             bottomMargin=0.75 * inch
         )
 
-        # Define styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles for better formatting
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            textColor='black',
-            spaceAfter=12,
-            alignment=TA_LEFT,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor='black',
-            spaceAfter=10,
-            spaceBefore=10,
-            alignment=TA_LEFT,
-            fontName='Helvetica-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['Normal'],
-            fontSize=11,
-            textColor='black',
-            spaceAfter=8,
-            alignment=TA_JUSTIFY,
-            fontName='Times-Roman',
-            leading=14
-        )
+        styles_by_kind = _styles()
 
         # Build the story (content)
         story = []
         
-        # Split text into paragraphs and process
-        paragraphs = cleaned_text.split('\n\n')
-        
-        for para in paragraphs:
-            if not para.strip():
-                story.append(Spacer(1, 0.2 * inch))
-                continue
-            
-            para = para.strip()
-            
-            # Check if it's a heading (all caps or starts with #)
-            if para.upper() == para and len(para) < 100 and para.isupper():
-                story.append(Paragraph(para, heading_style))
-            elif para.startswith('#'):
-                # Markdown heading
-                level = len(para) - len(para.lstrip('#'))
-                para_text = para.lstrip('#').strip()
-                if level == 1:
-                    story.append(Paragraph(para_text, title_style))
-                else:
-                    story.append(Paragraph(para_text, heading_style))
-            else:
-                # Regular paragraph - escape special characters for ReportLab
-                para = para.replace('&', '&amp;')
-                para = para.replace('<', '&lt;')
-                para = para.replace('>', '&gt;')
-                story.append(Paragraph(para, body_style))
-            
-            story.append(Spacer(1, 0.15 * inch))
+        for kind, para_text in _iter_blocks(html):
+            story.append(Paragraph(para_text, styles_by_kind[kind]))
 
         # Build the PDF
         doc.build(story)
@@ -175,6 +330,8 @@ def save_report_to_pdf(text: str, file_path: str) -> str:
         return file_path
         
     except OSError as e:
+        # The directory may have been removed since it was created; re-check next time
+        _ENSURED_DIRS.discard(output_dir)
         error_msg = f"Failed to create output directory or write PDF file: {e}"
         logger.error(error_msg)
         raise OSError(error_msg) from e
@@ -0,0 +1,101 @@
+"""On-disk cache for generated report text.
+
+Entries are stored as JSON files named after a SHA-256 digest of the inputs
+that determine the crew's output (topic, date, models), so repeated runs for
+an unchanged topic skip the LLM pipeline entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS: float = 24 * 60 * 60
+
+
+def make_cache_key(**parts: Any) -> str:
+    """Build a stable cache key from the inputs of a crew run.
+
+    Args:
+        **parts: JSON-serializable values identifying the run (topic, date, models...).
+
+    Returns:
+        Hex-encoded SHA-256 digest of the canonical JSON encoding of ``parts``.
+
+    Example:
+        >>> make_cache_key(topic="AI", as_of="2025-01-01") == make_cache_key(as_of="2025-01-01", topic="AI")
+        True
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_report(cache_dir: str, key: str, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> Optional[str]:
+    """Return the cached report text for ``key`` if present and not expired.
+
+    Args:
+        cache_dir: Directory holding the cache entries.
+        key: Cache key produced by ``make_cache_key``.
+        ttl_seconds: Maximum age of an entry before it is ignored.
+
+    Returns:
+        The cached report text, or None on a miss, an expired entry, or an unreadable file.
+    """
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        # ValueError covers both invalid JSON and undecodable bytes
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+    if not isinstance(entry, dict):
+        logger.warning(f"Ignoring unreadable cache entry {path}: not a JSON object")
+        return None
+    try:
+        age = time.time() - float(entry.get("created_at", 0))
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+    if age > ttl_seconds:
+        logger.info(f"Cache entry {key} expired ({age:.0f}s old)")
+        return None
+
+    report_text = entry.get("report_text")
+    return report_text if isinstance(report_text, str) and report_text else None
+
+
+def store_cached_report(cache_dir: str, key: str, report_text: str) -> None:
+    """Persist report text under ``key``.
+
+    The entry is written to a uniquely named temporary file first and then
+    atomically moved into place, so concurrent readers never observe a
+    partial entry and concurrent writers never share a temporary file.
+
+    Args:
+        cache_dir: Directory holding the cache entries (created if missing).
+        key: Cache key produced by ``make_cache_key``.
+        report_text: Report text to cache.
+
+    Raises:
+        OSError: If the cache directory or entry cannot be written.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{key}.json")
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "report_text": report_text}, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    logger.info(f"Cached report text under key {key}")